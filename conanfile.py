@@ -1,5 +1,7 @@
+import shutil
+
 from conan import ConanFile
-from conan.tools.cmake import cmake_layout
+from conan.tools.cmake import CMakeToolchain, cmake_layout
 
 
 class NodoConan(ConanFile):
@@ -12,12 +14,14 @@ class NodoConan(ConanFile):
     # Options
     options = {
         "with_tests": [True, False],
+        "with_ui": [True, False],
         "system_qt": [True, False],
     }
 
     # Default options for dependencies
     default_options = {
         "with_tests": False,
+        "with_ui": True,
         "system_qt": False,
         "boost/*:without_test": True,
         "gtest/*:shared": False,
@@ -32,20 +36,35 @@ class NodoConan(ConanFile):
     generators = "CMakeDeps"
 
     def generate(self):
-        from conan.tools.cmake import CMakeToolchain
-
         tc = CMakeToolchain(self)
 
         # Prefer a generator that does not require a pre-initialized MSVC
         # environment. Visual Studio generator invokes MSBuild and sets up
-        # the toolchain without needing to run vcvarsall.bat manually.
+        # the toolchain without needing to run vcvarsall.bat manually —
+        # the documented flow runs `cmake --preset` from a plain shell, and
+        # Ninja would need cl.exe on PATH there (Developer Prompt). The
+        # Conan-driven pmp/manifold recipe builds do use Ninja, where Conan
+        # injects conanvcvars itself.
         if str(self.settings.os) == "Windows" and str(self.settings.compiler) in (
             "msvc",
             "Visual Studio",
         ):
             tc.generator = "Visual Studio 17 2022"
-        # On other platforms, let CMake pick a reasonable default (or override
-        # via tools.cmake.cmaketoolchain:generator in profiles).
+        elif shutil.which("ninja"):
+            # Prefer Ninja over the Makefiles default when it is available
+            # (or override via tools.cmake.cmaketoolchain:generator in
+            # profiles).
+            tc.generator = "Ninja"
+
+        # Keep the CMake options in sync with the Conan ones so disabling
+        # tests or the UI also drops the matching find_package requirement.
+        tc.variables["NODO_BUILD_TESTS"] = "ON" if self.options.with_tests else "OFF"
+        tc.variables["NODO_BUILD_STUDIO"] = "ON" if self.options.with_ui else "OFF"
+
+        # Reuse compilation results across rebuilds when ccache is around
+        if shutil.which("ccache"):
+            tc.variables["CMAKE_C_COMPILER_LAUNCHER"] = "ccache"
+            tc.variables["CMAKE_CXX_COMPILER_LAUNCHER"] = "ccache"
 
         tc.generate()
 
@@ -63,12 +82,14 @@ class NodoConan(ConanFile):
         # Expression evaluation for WrangleSOP (header-only, MIT license)
         self.requires("exprtk/0.0.2")
 
-        # Qt for UI (skip if using system Qt)
-        if not self.options.system_qt:
+        # Qt for UI; by far the heaviest package in the graph, so headless
+        # jobs (CLI, core tests, doc generation) should pass -o with_ui=False
+        if self.options.with_ui and not self.options.system_qt:
             self.requires("qt/6.7.0")
 
-        # Testing
-        self.requires("gtest/1.14.0")
+        # Testing (kept out of the graph unless tests are enabled)
+        if self.options.with_tests:
+            self.requires("gtest/1.14.0")
 
     def layout(self):
         """Define the layout for the build"""
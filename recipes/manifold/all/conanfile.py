@@ -10,6 +10,7 @@ from conan.tools.files import (
 )
 from conan.tools.scm import Version
 import os
+import shutil
 
 required_conan_version = ">=2.0.0"
 
@@ -60,6 +61,12 @@ class ManifoldConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        # Ninja is faster than the MSBuild/Makefiles defaults; keep the
+        # generator choice consistent with the top-level recipe.
+        if str(self.settings.os) == "Windows":
+            tc.generator = "Ninja Multi-Config"
+        elif shutil.which("ninja"):
+            tc.generator = "Ninja"
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
         tc.cache_variables["BUILD_SHARED_LIBS"] = self.options.shared
         tc.cache_variables["CMAKE_MSVC_RUNTIME_LIBRARY"] = (
@@ -73,6 +80,9 @@ class ManifoldConan(ConanFile):
         tc.cache_variables["MANIFOLD_PYBIND"] = False
         tc.cache_variables["MANIFOLD_STRICT"] = False  # no -Werror
         tc.cache_variables["MANIFOLD_PAR"] = self.options.with_parallel_acceleration
+        if shutil.which("ccache"):
+            tc.cache_variables["CMAKE_C_COMPILER_LAUNCHER"] = "ccache"
+            tc.cache_variables["CMAKE_CXX_COMPILER_LAUNCHER"] = "ccache"
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -81,7 +91,15 @@ class ManifoldConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
-        cmake.configure()
+        # NODO_PROFILE_CMAKE=1 dumps a google-trace of the configure step
+        # (view with speedscope.app or chrome://tracing)
+        cli_args = None
+        if os.environ.get("NODO_PROFILE_CMAKE") == "1":
+            cli_args = [
+                "--profiling-format=google-trace",
+                f"--profiling-output={os.path.join(self.build_folder, 'cmake_profile.json')}",
+            ]
+        cmake.configure(cli_args=cli_args)
         cmake.build()
 
     def package(self):
@@ -3,6 +3,7 @@ from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.files import copy, get, rmdir
 import os
+import shutil
 
 required_conan_version = ">=2.0.0"
 
@@ -45,7 +46,23 @@ class PMPConan(ConanFile):
 
     def generate(self):
         tc = CMakeToolchain(self)
+        # Ninja is faster than the MSBuild/Makefiles defaults; keep the
+        # generator choice consistent with the top-level recipe.
+        if str(self.settings.os) == "Windows":
+            tc.generator = "Ninja Multi-Config"
+        elif shutil.which("ninja"):
+            tc.generator = "Ninja"
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        # The compiler already passed detection for the consuming graph;
+        # preload the answers so configure skips the try_compile probes
+        # (spawn + link per probe) on every conan build.
+        tc.cache_variables["CMAKE_C_COMPILER_WORKS"] = "TRUE"
+        tc.cache_variables["CMAKE_CXX_COMPILER_WORKS"] = "TRUE"
+        tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
+        tc.cache_variables["CMAKE_TRY_COMPILE_TARGET_TYPE"] = "STATIC_LIBRARY"
+        if shutil.which("ccache"):
+            tc.cache_variables["CMAKE_C_COMPILER_LAUNCHER"] = "ccache"
+            tc.cache_variables["CMAKE_CXX_COMPILER_LAUNCHER"] = "ccache"
         tc.cache_variables["BUILD_SHARED_LIBS"] = self.options.shared
         tc.cache_variables["PMP_BUILD_EXAMPLES"] = False
         tc.cache_variables["PMP_BUILD_TESTS"] = False
@@ -58,7 +75,15 @@ class PMPConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
-        cmake.configure()
+        # NODO_PROFILE_CMAKE=1 dumps a google-trace of the configure step
+        # (view with speedscope.app or chrome://tracing)
+        cli_args = None
+        if os.environ.get("NODO_PROFILE_CMAKE") == "1":
+            cli_args = [
+                "--profiling-format=google-trace",
+                f"--profiling-output={os.path.join(self.build_folder, 'cmake_profile.json')}",
+            ]
+        cmake.configure(cli_args=cli_args)
         cmake.build()
 
     def package(self):
@@ -11,14 +11,56 @@ Usage:
 Output: docs/nodes/{category}/{node_name}.md
 """
 
+from __future__ import annotations
+
+import json
 import re
 import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from hashlib import blake2b
+
+
+# Precompiled patterns, hoisted to module scope so the parse loop does not
+# pay a regex-cache lookup per call.
+_FACTORY_ROW_RE = re.compile(r'\{NodeType::(\w+),\s*"([^"]+)",\s*"([^"]+)",\s*"([^"]+)"\}')
+_PARAM_BLOCK_RE = re.compile(r'register_parameter\((.*?)\);', re.DOTALL)
+_TYPE_NAME_RE = re.compile(r'define_(int|float|bool|string)_parameter\("([^"]+)",\s*([^)]+)\)')
+_LABEL_RE = re.compile(r'\.label\("([^"]+)"\)')
+_RANGE_RE = re.compile(r'\.range\(([^,]+),\s*([^)]+)\)')
+_OPTIONS_RE = re.compile(r'\.options\(\{([^}]+)\}\)')
+_CATEGORY_RE = re.compile(r'\.category\("([^"]+)"\)')
+_DESC_RE = re.compile(r'\.description\("([^"]+)"\)')
+_INPUT_CONFIG_RE = re.compile(r'InputConfig\(InputType::(\w+),\s*(\d+),\s*(\d+),\s*(\d+)\)')
+
+# Per-node document skeleton; section bodies are pre-joined strings so a
+# single format() call replaces dozens of tiny list appends per node.
+_NODE_TEMPLATE = """# {name}
+
+**Category:** {category}
+
+## Description
+
+{description}
+
+## Inputs
+
+{inputs}
+
+{parameters}## Example Usage
+
+{example}
 
+## See Also
 
-@dataclass
+{see_also}
+"""
+
+
+@dataclass(slots=True, frozen=True)
 class NodeMetadata:
     """Metadata for a single node type"""
     type: str
@@ -27,21 +69,21 @@ class NodeMetadata:
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parameter:
     """Node parameter definition"""
     name: str
     type: str  # int, float, bool, string
     label: str
-    default: Optional[str]
-    range_min: Optional[str]
-    range_max: Optional[str]
-    options: List[str]  # For combo boxes
+    default: str | None
+    range_min: str | None
+    range_max: str | None
+    options: tuple[str, ...]  # For combo boxes
     category: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InputConfig:
     """Node input configuration"""
     input_type: str  # NONE, SINGLE, MULTIPLE
@@ -50,6 +92,132 @@ class InputConfig:
     required: int
 
 
+def _extract_parameters(content: str) -> list[Parameter]:
+    """Extract parameter definitions from register_parameter() calls"""
+    parameters = []
+
+    # Pattern for parameter registration
+    # Example: define_float_parameter("radius", DEFAULT_RADIUS)
+    #            .label("Radius")
+    #            .range(0.01, 100.0)
+    #            .category("Size")
+    #            .description("...")
+
+    # Find all register_parameter blocks
+    param_blocks = _PARAM_BLOCK_RE.findall(content)
+
+    for block in param_blocks:
+        param = _parse_parameter_block(block)
+        if param:
+            parameters.append(param)
+
+    return parameters
+
+
+@lru_cache(maxsize=None)
+def _parse_parameter_block(block: str) -> Parameter | None:
+    """Parse a single parameter definition block.
+
+    Parameter is frozen/hashable, so identical blocks shared between
+    headers are interned via the cache.
+    """
+    # Extract type and name
+    type_match = _TYPE_NAME_RE.search(block)
+    if not type_match:
+        return None
+
+    param_type, param_name, default_value = type_match.groups()
+
+    # Extract label
+    label_match = _LABEL_RE.search(block)
+    label = label_match.group(1) if label_match else param_name.title()
+
+    # Extract range
+    range_match = _RANGE_RE.search(block)
+    range_min = range_match.group(1).strip() if range_match else None
+    range_max = range_match.group(2).strip() if range_match else None
+
+    # Extract options (for combo boxes)
+    options_match = _OPTIONS_RE.search(block)
+    options = ()
+    if options_match:
+        options_str = options_match.group(1)
+        options = tuple(opt.strip().strip('"') for opt in options_str.split(','))
+
+    # Extract category
+    category_match = _CATEGORY_RE.search(block)
+    category = category_match.group(1) if category_match else "General"
+
+    # Extract description
+    desc_match = _DESC_RE.search(block)
+    description = desc_match.group(1) if desc_match else ""
+
+    return Parameter(
+        name=param_name,
+        type=param_type,
+        label=label,
+        default=default_value,
+        range_min=range_min,
+        range_max=range_max,
+        options=options,
+        category=category,
+        description=description
+    )
+
+
+def _extract_input_config(content: str) -> InputConfig:
+    """Extract input configuration from get_input_config()"""
+    config_match = _INPUT_CONFIG_RE.search(content)
+
+    if config_match:
+        input_type, min_in, max_in, required = config_match.groups()
+        return InputConfig(input_type, int(min_in), int(max_in), int(required))
+
+    # Default: single input modifier
+    return InputConfig("SINGLE", 1, 1, 1)
+
+
+def _param_from_dict(d: dict) -> Parameter:
+    """Rebuild a Parameter from a cached/worker dict"""
+    return Parameter(**{**d, "options": tuple(d["options"])})
+
+
+def _parse_one(args: tuple[str, str]) -> tuple[str, list[dict], dict]:
+    """Worker: read and parse one SOP header.
+
+    Top-level function (not a method) so ProcessPoolExecutor can pickle
+    it; returns plain dicts for the same reason.
+    """
+    node_type, header_path = args
+    content = Path(header_path).read_text(encoding='utf-8')
+    parameters = _extract_parameters(content)
+    input_config = _extract_input_config(content)
+    return node_type, [asdict(p) for p in parameters], asdict(input_config)
+
+
+def _doc_hash(markdown: str) -> str:
+    """Content digest used to detect unchanged doc pages"""
+    return blake2b(markdown.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _render_and_write(args: tuple['NodeDocGenerator', NodeMetadata, list[Parameter], InputConfig, Path]) -> tuple[str, str]:
+    """Worker: render one node's markdown and write it to disk.
+
+    Writing is skipped when the content hash matches the previous run,
+    so unchanged pages keep their mtime and downstream doc-site builds
+    stay on their incremental path. Returns (rel_path, digest) for the
+    parent to record.
+    """
+    generator, node, parameters, input_config, output_path = args
+    markdown = generator.generate_node_doc(node, parameters, input_config)
+
+    rel = output_path.relative_to(generator.docs_dir).as_posix()
+    digest = _doc_hash(markdown)
+    if not (generator._hashes.get(rel) == digest and output_path.exists()):
+        output_path.write_text(markdown, encoding='utf-8')
+    return rel, digest
+
+
 class NodeDocGenerator:
     """Generate documentation for Nodo nodes"""
 
@@ -57,17 +225,79 @@ class NodeDocGenerator:
         self.project_root = project_root
         self.nodo_core = project_root / "nodo_core"
         self.docs_dir = project_root / "docs"
-
-    def parse_sop_factory(self) -> List[NodeMetadata]:
+        self._sop_include_dir = self.nodo_core / "include/nodo/sop"
+        self._header_index = self._index_headers()
+        self._cache_file = self.docs_dir / ".node_doc_cache.json"
+        self._cache = self._load_cache()
+        self._cache_dirty = False
+        self._hash_file = self.docs_dir / ".node_doc_hashes.json"
+        self._hashes = self._load_hashes()
+        self._hashes_dirty = False
+
+    def _index_headers(self) -> dict[str, Path]:
+        """Map lowercased node type to header path with one directory read.
+
+        A single scandir replaces a stat() per node. Each header is
+        indexed under its stem and under the stem with underscores
+        stripped, so CamelCase node types resolve their snake_case
+        headers (NodeType::CopyToPoints -> copy_to_points_sop.hpp).
+        """
+        index: dict[str, Path] = {}
+        try:
+            for entry in os.scandir(self._sop_include_dir):
+                if not entry.name.endswith("_sop.hpp"):
+                    continue
+                stem = entry.name[:-len("_sop.hpp")].lower()
+                path = Path(entry.path)
+                index[stem] = path
+                index.setdefault(stem.replace("_", ""), path)
+        except OSError:
+            return {}
+        return index
+
+    def _load_cache(self) -> dict:
+        """Load the on-disk header parse cache (empty on first run)"""
+        try:
+            with open(self._cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self):
+        """Persist the header parse cache if anything was re-parsed"""
+        if not self._cache_dirty:
+            return
+        with open(self._cache_file, 'w') as f:
+            json.dump(self._cache, f)
+
+    def _load_hashes(self) -> dict:
+        """Load the rel_path -> digest map of previously written docs"""
+        try:
+            with open(self._hash_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_hashes(self):
+        """Persist the doc content hashes if any page changed"""
+        if not self._hashes_dirty:
+            return
+        with open(self._hash_file, 'w') as f:
+            json.dump(self._hashes, f)
+
+    def _record_hash(self, rel: str, digest: str):
+        """Note a page's digest, marking the map dirty on change"""
+        if self._hashes.get(rel) != digest:
+            self._hashes[rel] = digest
+            self._hashes_dirty = True
+
+    def parse_sop_factory(self) -> list[NodeMetadata]:
         """Parse SOPFactory::get_all_available_nodes() for node list"""
         factory_file = self.nodo_core / "src/sop/sop_factory.cpp"
+        content = factory_file.read_text(encoding='utf-8')
 
-        with open(factory_file, 'r') as f:
-            content = f.read()
-
-        # Find the get_all_available_nodes() function
-        pattern = r'\{NodeType::(\w+),\s*"([^"]+)",\s*"([^"]+)",\s*"([^"]+)"\}'
-        matches = re.findall(pattern, content)
+        # Find the get_all_available_nodes() node table
+        matches = _FACTORY_ROW_RE.findall(content)
 
         nodes = []
         for match in matches:
@@ -82,191 +312,161 @@ class NodeDocGenerator:
         print(f"✓ Found {len(nodes)} nodes in SOPFactory")
         return nodes
 
-    def parse_sop_header(self, node_type: str) -> Tuple[List[Parameter], InputConfig]:
+    def parse_sop_header(self, node_type: str) -> tuple[list[Parameter], InputConfig]:
         """Parse individual SOP header file for parameters and inputs"""
         # Convert NodeType to header filename (e.g., Sphere -> sphere_sop.hpp)
-        header_name = f"{node_type.lower()}_sop.hpp"
-        header_file = self.nodo_core / "include/nodo/sop" / header_name
+        header_file = self._header_index.get(node_type.lower())
 
-        if not header_file.exists():
-            print(f"  ⚠ Header not found: {header_file}")
+        if header_file is None:
+            print(f"  ⚠ Header not found: {self._sop_include_dir / f'{node_type.lower()}_sop.hpp'}")
             return [], InputConfig("UNKNOWN", 0, 0, 0)
 
-        with open(header_file, 'r') as f:
-            content = f.read()
+        # Skip re-parsing when the header is unchanged since the last run
+        stat = header_file.stat()
+        cached = self._cache_lookup(header_file, stat)
+        if cached:
+            return cached
 
-        parameters = self._extract_parameters(content)
-        input_config = self._extract_input_config(content)
+        content = header_file.read_text(encoding='utf-8')
+
+        parameters = _extract_parameters(content)
+        input_config = _extract_input_config(content)
+
+        self._cache_store(header_file, stat,
+                          [asdict(p) for p in parameters], asdict(input_config))
 
         return parameters, input_config
 
-    def _extract_parameters(self, content: str) -> List[Parameter]:
-        """Extract parameter definitions from register_parameter() calls"""
-        parameters = []
-
-        # Pattern for parameter registration
-        # Example: define_float_parameter("radius", DEFAULT_RADIUS)
-        #            .label("Radius")
-        #            .range(0.01, 100.0)
-        #            .category("Size")
-        #            .description("...")
-
-        # Find all register_parameter blocks
-        param_blocks = re.findall(
-            r'register_parameter\((.*?)\);',
-            content,
-            re.DOTALL
-        )
+    def _cache_lookup(self, header_file: Path, stat: os.stat_result) -> tuple[list[Parameter], InputConfig] | None:
+        """Return cached parse results if the header is unchanged"""
+        cached = self._cache.get(str(header_file))
+        if (cached
+                and cached["mtime_ns"] == stat.st_mtime_ns
+                and cached["size"] == stat.st_size):
+            parameters = [_param_from_dict(p) for p in cached["params"]]
+            return parameters, InputConfig(**cached["input"])
+        return None
+
+    def _cache_store(self, header_file: Path, stat: os.stat_result,
+                     params: list[dict], input_config: dict):
+        """Record parse results (as plain dicts) in the cache"""
+        self._cache[str(header_file)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "params": params,
+            "input": input_config,
+        }
+        self._cache_dirty = True
 
-        for block in param_blocks:
-            param = self._parse_parameter_block(block)
-            if param:
-                parameters.append(param)
-
-        return parameters
-
-    def _parse_parameter_block(self, block: str) -> Optional[Parameter]:
-        """Parse a single parameter definition block"""
-        # Extract type and name
-        type_match = re.search(r'define_(int|float|bool|string)_parameter\("([^"]+)",\s*([^)]+)\)', block)
-        if not type_match:
-            return None
-
-        param_type, param_name, default_value = type_match.groups()
-
-        # Extract label
-        label_match = re.search(r'\.label\("([^"]+)"\)', block)
-        label = label_match.group(1) if label_match else param_name.title()
-
-        # Extract range
-        range_match = re.search(r'\.range\(([^,]+),\s*([^)]+)\)', block)
-        range_min = range_match.group(1).strip() if range_match else None
-        range_max = range_match.group(2).strip() if range_match else None
-
-        # Extract options (for combo boxes)
-        options_match = re.search(r'\.options\(\{([^}]+)\}\)', block)
-        options = []
-        if options_match:
-            options_str = options_match.group(1)
-            options = [opt.strip().strip('"') for opt in options_str.split(',')]
-
-        # Extract category
-        category_match = re.search(r'\.category\("([^"]+)"\)', block)
-        category = category_match.group(1) if category_match else "General"
-
-        # Extract description
-        desc_match = re.search(r'\.description\("([^"]+)"\)', block)
-        description = desc_match.group(1) if desc_match else ""
-
-        return Parameter(
-            name=param_name,
-            type=param_type,
-            label=label,
-            default=default_value,
-            range_min=range_min,
-            range_max=range_max,
-            options=options,
-            category=category,
-            description=description
-        )
+    def _parse_all_headers(self, nodes: list[NodeMetadata]) -> dict[str, tuple[list[Parameter], InputConfig]]:
+        """Parse every SOP header once, keyed by node type.
 
-    def _extract_input_config(self, content: str) -> InputConfig:
-        """Extract input configuration from get_input_config()"""
-        config_match = re.search(
-            r'InputConfig\(InputType::(\w+),\s*(\d+),\s*(\d+),\s*(\d+)\)',
-            content
-        )
+        Cache hits are resolved in-process; the remaining headers are
+        CPU-bound regex work and are parsed in parallel across worker
+        processes. Each header is read and regex-scanned a single time
+        even when re-runs or multiple nodes reference it, so the
+        generation loop afterwards is purely in-memory.
+        """
+        parsed: dict[str, tuple[list[Parameter], InputConfig]] = {}
+        pending: list[tuple[str, Path, os.stat_result]] = []
 
-        if config_match:
-            input_type, min_in, max_in, required = config_match.groups()
-            return InputConfig(input_type, int(min_in), int(max_in), int(required))
+        for node in nodes:
+            if node.type in parsed or any(p[0] == node.type for p in pending):
+                continue
 
-        # Default: single input modifier
-        return InputConfig("SINGLE", 1, 1, 1)
+            header_file = self._header_index.get(node.type.lower())
+            if header_file is None:
+                print(f"  ⚠ Header not found: {self._sop_include_dir / f'{node.type.lower()}_sop.hpp'}")
+                parsed[node.type] = ([], InputConfig("UNKNOWN", 0, 0, 0))
+                continue
 
-    def generate_node_doc(self, node: NodeMetadata) -> str:
+            stat = header_file.stat()
+            cached = self._cache_lookup(header_file, stat)
+            if cached:
+                parsed[node.type] = cached
+            else:
+                pending.append((node.type, header_file, stat))
+
+        if pending:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(
+                    _parse_one,
+                    [(node_type, str(header_file)) for node_type, header_file, _ in pending]
+                ))
+            stats = {node_type: (header_file, stat) for node_type, header_file, stat in pending}
+            for node_type, params, input_config in results:
+                header_file, stat = stats[node_type]
+                self._cache_store(header_file, stat, params, input_config)
+                parsed[node_type] = ([_param_from_dict(p) for p in params],
+                                     InputConfig(**input_config))
+
+        return parsed
+
+    def generate_node_doc(self, node: NodeMetadata, parameters: list[Parameter],
+                          input_config: InputConfig) -> str:
         """Generate Markdown documentation for a single node"""
-        parameters, input_config = self.parse_sop_header(node.type)
-
-        # Start building markdown
-        md = []
-        md.append(f"# {node.name}")
-        md.append("")
-        md.append(f"**Category:** {node.category}")
-        md.append("")
-        md.append("## Description")
-        md.append("")
-        md.append(node.description)
-        md.append("")
+        return _NODE_TEMPLATE.format(
+            name=node.name,
+            category=node.category,
+            description=node.description,
+            inputs=self._render_inputs(input_config),
+            parameters=self._render_params(parameters),
+            example=self._generate_example(node, parameters),
+            see_also=self._generate_see_also(node),
+        )
 
-        # Inputs section
-        md.append("## Inputs")
-        md.append("")
+    def _render_inputs(self, input_config: InputConfig) -> str:
+        """Render the Inputs section body"""
         if input_config.input_type == "NONE":
-            md.append("This node generates geometry and requires no inputs.")
-        elif input_config.input_type == "SINGLE":
-            md.append(f"- **Input 0**: Geometry to process")
-        elif input_config.input_type == "MULTIPLE":
+            return "This node generates geometry and requires no inputs."
+        if input_config.input_type == "SINGLE":
+            return "- **Input 0**: Geometry to process"
+        if input_config.input_type == "DUAL":
+            return ("- **Input 0**: First geometry input\n"
+                    "- **Input 1**: Second geometry input")
+        if input_config.input_type == "MULTIPLE":
             if input_config.max_inputs == -1:
-                md.append(f"- **Inputs**: Accepts {input_config.min_inputs}+ geometry inputs")
-            else:
-                md.append(f"- **Inputs**: Accepts {input_config.min_inputs}-{input_config.max_inputs} geometry inputs")
-        md.append("")
+                return f"- **Inputs**: Accepts {input_config.min_inputs}+ geometry inputs"
+            return f"- **Inputs**: Accepts {input_config.min_inputs}-{input_config.max_inputs} geometry inputs"
+        return ""
 
-        # Parameters section
-        if parameters:
-            md.append("## Parameters")
-            md.append("")
+    def _render_params(self, parameters: list[Parameter]) -> str:
+        """Render the Parameters section (empty string when there are none)"""
+        if not parameters:
+            return ""
 
-            # Group by category
-            by_category: Dict[str, List[Parameter]] = {}
-            for param in parameters:
-                if param.category not in by_category:
-                    by_category[param.category] = []
-                by_category[param.category].append(param)
-
-            for category, params in by_category.items():
-                md.append(f"### {category}")
-                md.append("")
-
-                for param in params:
-                    # Parameter name and type
-                    md.append(f"**{param.label}** (`{param.type}`)")
-                    md.append("")
-
-                    # Description
-                    if param.description:
-                        md.append(param.description)
-                        md.append("")
-
-                    # Details
-                    details = []
-                    if param.default:
-                        details.append(f"Default: `{param.default}`")
-                    if param.range_min and param.range_max:
-                        details.append(f"Range: `{param.range_min}` to `{param.range_max}`")
-                    if param.options:
-                        details.append(f"Options: {', '.join([f'`{opt}`' for opt in param.options])}")
-
-                    if details:
-                        md.append("- " + " | ".join(details))
-                        md.append("")
-
-        # Example usage section
-        md.append("## Example Usage")
-        md.append("")
-        md.append(self._generate_example(node, parameters))
-        md.append("")
+        # Group by category
+        by_category: dict[str, list[Parameter]] = defaultdict(list)
+        for param in parameters:
+            by_category[param.category].append(param)
 
-        # See also section
-        md.append("## See Also")
-        md.append("")
-        md.append(self._generate_see_also(node))
-        md.append("")
+        sections = []
+        for category, params in by_category.items():
+            blocks = [self._render_param(param) for param in params]
+            sections.append(f"### {category}\n\n" + "\n\n".join(blocks))
+
+        return "## Parameters\n\n" + "\n\n".join(sections) + "\n\n"
+
+    def _render_param(self, param: Parameter) -> str:
+        """Render one parameter block"""
+        block = f"**{param.label}** (`{param.type}`)"
+
+        if param.description:
+            block += f"\n\n{param.description}"
+
+        details = []
+        if param.default:
+            details.append(f"Default: `{param.default}`")
+        if param.range_min and param.range_max:
+            details.append(f"Range: `{param.range_min}` to `{param.range_max}`")
+        if param.options:
+            details.append(f"Options: {', '.join([f'`{opt}`' for opt in param.options])}")
+        if details:
+            block += "\n\n- " + " | ".join(details)
 
-        return "\n".join(md)
+        return block
 
-    def _generate_example(self, node: NodeMetadata, parameters: List[Parameter]) -> str:
+    def _generate_example(self, node: NodeMetadata, parameters: list[Parameter]) -> str:
         """Generate example usage text"""
         if node.category == "Generator":
             return f"Create a {node.name} node from the Node Library panel. Adjust parameters to customize the generated geometry."
@@ -301,33 +501,41 @@ class NodeDocGenerator:
         # Parse all nodes from factory
         nodes = self.parse_sop_factory()
 
-        # Create docs directory structure
-        for node in nodes:
-            category_dir = self.docs_dir / "nodes" / node.category.lower()
+        # Create docs directory structure (one mkdir per unique category)
+        unique_dirs = {self.docs_dir / "nodes" / node.category.lower() for node in nodes}
+        for category_dir in unique_dirs:
             category_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate docs for each node
+        # Phase 1: parse every header once
+        parsed = self._parse_all_headers(nodes)
+
+        # Phase 2: render and write docs in parallel worker processes
         print("\nGenerating documentation:")
+        tasks = []
         for node in nodes:
             print(f"  • {node.name} ({node.category})")
 
-            # Generate markdown
-            markdown = self.generate_node_doc(node)
-
-            # Write to file
+            parameters, input_config = parsed[node.type]
             filename = node.name.lower().replace(" ", "_") + ".md"
             output_path = self.docs_dir / "nodes" / node.category.lower() / filename
+            tasks.append((self, node, parameters, input_config, output_path))
 
-            with open(output_path, 'w') as f:
-                f.write(markdown)
+        with ProcessPoolExecutor() as executor:
+            # Drain the iterator so worker exceptions propagate
+            for rel, digest in executor.map(_render_and_write, tasks):
+                self._record_hash(rel, digest)
 
         # Generate index page
         self._generate_node_index(nodes)
 
+        # Persist the parse cache and content hashes for the next run
+        self._save_cache()
+        self._save_hashes()
+
         print(f"\n✓ Generated {len(nodes)} node documentation pages")
         print(f"✓ Output: {self.docs_dir / 'nodes'}")
 
-    def _generate_node_index(self, nodes: List[NodeMetadata]):
+    def _generate_node_index(self, nodes: list[NodeMetadata]):
         """Generate nodes/index.md with all nodes categorized"""
         md = []
         md.append("# Node Reference")
@@ -336,10 +544,8 @@ class NodeDocGenerator:
         md.append("")
 
         # Group by category
-        by_category: Dict[str, List[NodeMetadata]] = {}
+        by_category: dict[str, list[NodeMetadata]] = defaultdict(list)
         for node in nodes:
-            if node.category not in by_category:
-                by_category[node.category] = []
             by_category[node.category].append(node)
 
         # Sort categories
@@ -359,8 +565,13 @@ class NodeDocGenerator:
             md.append("")
 
         output_path = self.docs_dir / "nodes" / "index.md"
-        with open(output_path, 'w') as f:
-            f.write("\n".join(md))
+        markdown = "\n".join(md)
+
+        rel = output_path.relative_to(self.docs_dir).as_posix()
+        digest = _doc_hash(markdown)
+        if not (self._hashes.get(rel) == digest and output_path.exists()):
+            output_path.write_text(markdown, encoding='utf-8')
+        self._record_hash(rel, digest)
 
         print(f"  • Node index page")
 